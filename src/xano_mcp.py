@@ -4,43 +4,226 @@ Xano MCP Server - Model Context Protocol server for Xano database integration
 Compatible with Smithery for AI agent integration
 """
 
-from typing import Any, Dict, List, Optional, Union, BinaryIO
+from typing import Any, Dict, List, Mapping, Optional, Union, BinaryIO
+from types import MappingProxyType
 import os
 import sys
+import abc
 import json
+import time
+import signal
 import asyncio
+import inspect
+import functools
 import argparse
 import logging
+import anyio
 import httpx
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import h2  # noqa: F401 - httpx needs it for HTTP/2
+except ImportError:
+    h2 = None
+
 # Initialize FastMCP server
 mcp = FastMCP("xano")
 
 # Constants
 XANO_GLOBAL_API = "https://app.xano.com/api:meta"
+SUPPORTED_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH"})
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('xano-mcp')
 
+# Connection pool defaults, sized for agents issuing bursts of parallel calls
+DEFAULT_MAX_CONNECTIONS = 1000
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 100
+
+# Seconds to wait for a Xano API call before giving up
+DEFAULT_HTTP_TIMEOUT = 30
+_http_timeout = DEFAULT_HTTP_TIMEOUT
+
+# Most record lookups coalesced into one search request
+DEFAULT_RECORD_BATCH_SIZE = 50
+_record_batch_size = DEFAULT_RECORD_BATCH_SIZE
+
+# Concurrent single-record creates are only sent as bulk requests when enabled
+DEFAULT_WRITE_BATCH_SIZE = 100
+_write_batch_size = DEFAULT_WRITE_BATCH_SIZE
+_batch_writes = False
+
+# Shared HTTP client, reused across tool calls so connections stay alive
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client(config=None) -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use
 
-# Extract token from environment or config
+    Args:
+        config: Optional configuration dictionary with pool settings
+            (max_connections, max_keepalive_connections, http2)
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        config = config or {}
+        http2 = config.get('http2', True)
+        if http2 and h2 is None:
+            logger.warning("HTTP/2 requested but the h2 package is not installed, using HTTP/1.1")
+            http2 = False
+
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=config.get('max_connections', DEFAULT_MAX_CONNECTIONS),
+                max_keepalive_connections=config.get(
+                    'max_keepalive_connections', DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+                ),
+            ),
+            # Only connects are bounded here; make_api_request's wait_for applies
+            # the configured http_timeout to the call as a whole
+            timeout=httpx.Timeout(None, connect=5.0),
+            http2=http2,
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared HTTP client and release its pooled connections"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# API token, resolved once at startup by load_token()
+_TOKEN: Optional[str] = None
+
+
+def load_token(config=None):
+    """Resolve the Xano API token from config or environment, exiting if missing"""
+    global _TOKEN
+
+    # Check config first (for Smithery integration), then the environment variable
+    if config and 'api_token' in config:
+        _TOKEN = config['api_token']
+    else:
+        _TOKEN = os.environ.get("XANO_API_TOKEN")
+
+    if not _TOKEN:
+        logger.error("Error: Xano API token not provided.")
+        logger.error("Either set XANO_API_TOKEN environment variable or provide it in config")
+        sys.exit(1)
+    return _TOKEN
+
+
+# Extract token from config or the value resolved at startup
 def get_token(config=None):
-    """Get the Xano API token from environment, config, or arguments"""
-    # Check config first (for Smithery integration)
+    """Get the Xano API token for a tool call"""
     if config and 'api_token' in config:
         return config['api_token']
-        
-    # Check environment variable
-    token = os.environ.get("XANO_API_TOKEN")
-    if token:
-        return token
+    return _TOKEN or load_token()
+
+
+@functools.lru_cache(maxsize=16)
+def _meta_api(instance_name: str) -> str:
+    """Base URL of the Metadata API for a Xano instance"""
+    return f"https://{instance_name}.n7c.xano.io/api:meta"
+
+
+@functools.lru_cache(maxsize=16)
+def _headers(token: str) -> Mapping[str, str]:
+    """Request headers for a token, read-only so they can be shared between calls"""
+    return MappingProxyType({
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    })
+
+
+# JSON helpers, using orjson when available and falling back to stdlib json
+def json_dumps(data) -> str:
+    """Serialize data to a JSON string"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data)
+
+
+def json_loads(content: bytes):
+    """Parse a JSON document, raising json.JSONDecodeError on invalid input"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# Validated GET responses keyed on (url, authorization, params), as (etag, last_modified, body)
+ETAG_CACHE_SIZE = 1024
+_etag_cache: Dict[tuple, tuple] = {}
+
+
+def _store_etag(key, response, body):
+    """Remember a GET response body if the server sent a validator for it"""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        _etag_cache.pop(key, None)
+        return
+
+    # Evict the oldest entry once full (dicts keep insertion order)
+    if key not in _etag_cache and len(_etag_cache) >= ETAG_CACHE_SIZE:
+        del _etag_cache[next(iter(_etag_cache))]
+    _etag_cache[key] = (etag, last_modified, body)
+
+
+# Request failures that tools report as {"error": ...} results; anything else propagates
+REQUEST_ERRORS = (
+    asyncio.TimeoutError,
+    httpx.TimeoutException,
+    httpx.ConnectError,
+    httpx.HTTPError,
+    httpx.InvalidURL,
+    json.JSONDecodeError,
+)
+
+
+# Prefix of the error reported when a request never reached Xano
+CONNECT_ERROR = "Could not connect to Xano"
+
 
-    # If no token found, print error and exit
-    logger.error("Error: Xano API token not provided.")
-    logger.error("Either set XANO_API_TOKEN environment variable or provide it in config")
-    sys.exit(1)
+def _never_applied(result):
+    """Whether an error result proves the request had no effect on the server
+
+    True for connect failures and 4xx rejections. Timeouts, 5xx responses and
+    dropped connections leave it open whether the server acted on the request.
+    """
+    status = result.get("status")
+    if status is not None:
+        return 400 <= status < 500
+    return result.get("error", "").startswith(CONNECT_ERROR)
+
+
+def _request_error(error, url, debug=False):
+    """Turn a request failure into the error result returned by the tools"""
+    if isinstance(error, (asyncio.TimeoutError, httpx.TimeoutException)):
+        if debug:
+            logger.error("Request to %s timed out after %ss", url, _http_timeout)
+        return {"error": "timeout"}
+
+    if debug:
+        logger.error("Exception during API request: %s", error)
+    if isinstance(error, httpx.ConnectError):
+        return {"error": f"{CONNECT_ERROR}: {str(error)}"}
+    return {"error": f"Exception during API request: {str(error)}"}
 
 
 # Utility function to make API requests
@@ -48,57 +231,184 @@ async def make_api_request(
     url, headers, method="GET", data=None, params=None, files=None, debug=False
 ):
     """Helper function to make API requests with consistent error handling"""
+    response = None
     try:
         if debug:
-            logger.info(f"Making {method} request to {url}")
+            logger.info("Making %s request to %s", method, url)
             if params:
-                logger.info(f"With params: {params}")
-            if data and not files:
-                logger.info(f"With data: {json.dumps(data)[:500]}...")
-
-        async with httpx.AsyncClient() as client:
-            if method == "GET":
-                response = await client.get(url, headers=headers, params=params)
-            elif method == "POST":
-                if files:
-                    # For multipart/form-data with file uploads
-                    response = await client.post(
-                        url, headers=headers, data=data, files=files
-                    )
+                logger.info("With params: %s", params)
+            if data and not files and logger.isEnabledFor(logging.INFO):
+                logger.info("With data: %s...", json_dumps(data)[:500])
+
+        if method not in SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported method: {method}")
+
+        kwargs = {}
+        if params:
+            kwargs["params"] = params
+        if files:
+            # For multipart/form-data with file uploads
+            kwargs["data"] = data
+            kwargs["files"] = files
+        elif data is not None and method != "GET":
+            kwargs["json"] = data
+
+        # Revalidate GETs we have seen before instead of downloading them again
+        etag_key = None
+        cached = None
+        if method == "GET":
+            etag_key = (
+                url,
+                headers.get("Authorization"),
+                tuple(sorted(params.items())) if params else None,
+            )
+            cached = _etag_cache.get(etag_key)
+            if cached is not None:
+                etag, last_modified, _ = cached
+                headers = dict(headers)
+                if etag:
+                    headers["If-None-Match"] = etag
                 else:
-                    response = await client.post(url, headers=headers, json=data)
-            elif method == "PUT":
-                response = await client.put(url, headers=headers, json=data)
-            elif method == "DELETE":
-                if data:
-                    response = await client.delete(url, headers=headers, json=data)
-                else:
-                    response = await client.delete(url, headers=headers)
-            elif method == "PATCH":
-                response = await client.patch(url, headers=headers, json=data)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
+                    headers["If-Modified-Since"] = last_modified
 
-            if debug:
-                logger.info(f"Response status: {response.status_code}")
-
-            if response.status_code == 200:
-                try:
-                    return response.json()
-                except json.JSONDecodeError:
-                    if debug:
-                        logger.error(f"Error parsing JSON response: {response.text[:200]}...")
-                    return {"error": "Failed to parse response as JSON"}
-            else:
+        request = get_client().request(method, url, headers=headers, **kwargs)
+
+        # wait_for cancels the request on timeout so its connection goes back to the pool
+        response = await asyncio.wait_for(request, timeout=_http_timeout)
+
+        if debug:
+            logger.info("Response status: %s", response.status_code)
+
+        if response.status_code == 304 and cached is not None:
+            return cached[2]
+
+        if response.status_code == 200:
+            try:
+                result = json_loads(response.content)
+            except json.JSONDecodeError:
                 if debug:
-                    logger.error(f"Error response: {response.text[:200]}...")
-                return {
-                    "error": f"API request failed with status {response.status_code}"
-                }
-    except Exception as e:
+                    logger.error("Error parsing JSON response: %s...", response.text[:200])
+                return {"error": "Failed to parse response as JSON"}
+
+            if etag_key is not None:
+                _store_etag(etag_key, response, result)
+            return result
+        else:
+            if debug:
+                logger.error("Error response: %s...", response.text[:200])
+            return {
+                "error": f"API request failed with status {response.status_code}",
+                "status": response.status_code,
+            }
+    except asyncio.CancelledError:
+        # Never swallow cancellation, the calling task has to see it
+        raise
+    except REQUEST_ERRORS as e:
+        return _request_error(e, url, debug)
+    finally:
+        if response is not None:
+            await response.aclose()
+
+
+class _AsyncByteReader:
+    """Async file-like view over an httpx byte stream, as ijson expects"""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def read(self, size=-1):
+        # ijson probes the stream type with a zero-length read first
+        if size == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+async def _stream_json(client, request, debug=False):
+    """Send a request and parse its JSON body incrementally as the bytes arrive"""
+    response = await client.send(request, stream=True)
+    try:
+        if debug:
+            logger.info("Response status: %s", response.status_code)
+
+        if response.status_code != 200:
+            await response.aread()
+            if debug:
+                logger.error("Error response: %s...", response.text[:200])
+            return {
+                "error": f"API request failed with status {response.status_code}",
+                "status": response.status_code,
+            }
+
+        try:
+            reader = _AsyncByteReader(response.aiter_bytes())
+            async for document in ijson.items(reader, "", use_float=True):
+                return document
+        except ijson.JSONError as e:
+            if debug:
+                logger.error("Error parsing JSON response: %s", e)
+        return {"error": "Failed to parse response as JSON"}
+    finally:
+        await response.aclose()
+
+
+# Utility function to make API requests for potentially large JSON responses
+@functools.lru_cache(maxsize=256)
+def _prepared_get(url: str, token: str) -> httpx.Request:
+    """GET request template for an endpoint, with URL and headers already processed
+
+    Templates are never sent directly; _with_params() derives a fresh request
+    from one, so a cached template is safe to share between concurrent calls.
+    """
+    return get_client().build_request("GET", url, headers=_headers(token))
+
+
+def _with_params(template: httpx.Request, params=None) -> httpx.Request:
+    """Derive a new request from a template, merging in query params"""
+    url = template.url.copy_merge_params(params) if params else template.url
+    return httpx.Request(
+        template.method, url, headers=template.headers, extensions=template.extensions
+    )
+
+
+async def make_streaming_api_request(
+    url, headers, method="GET", data=None, params=None, debug=False, request=None
+):
+    """Like make_api_request, but parses the response while streaming it
+
+    Avoids holding the raw body and the parsed records in memory at the same
+    time. Falls back to make_api_request when ijson is not installed.
+
+    Args:
+        request: Optional pre-built httpx.Request to send instead of building
+            one from url, headers, data and params
+    """
+    if ijson is None:
+        return await make_api_request(
+            url, headers, method=method, data=data, params=params, debug=debug
+        )
+
+    try:
         if debug:
-            logger.error(f"Exception during API request: {str(e)}")
-        return {"error": f"Exception during API request: {str(e)}"}
+            logger.info("Making streaming %s request to %s", method, url)
+            if params:
+                logger.info("With params: %s", params)
+            if data and logger.isEnabledFor(logging.INFO):
+                logger.info("With data: %s...", json_dumps(data)[:500])
+
+        client = get_client()
+        if request is None:
+            request = client.build_request(method, url, headers=headers, params=params, json=data)
+        return await asyncio.wait_for(
+            _stream_json(client, request, debug=debug), timeout=_http_timeout
+        )
+    except asyncio.CancelledError:
+        # Never swallow cancellation, the calling task has to see it
+        raise
+    except REQUEST_ERRORS as e:
+        return _request_error(e, url, debug)
 
 
 # Utility function to ensure IDs are properly formatted as strings
@@ -106,25 +416,331 @@ def format_id(id_value):
     """Ensures IDs are properly formatted strings"""
     if id_value is None:
         return None
+    # Exact type checks keep the common cases to one quick test each; an
+    # unquoted string is returned as-is without allocating a copy
+    if type(id_value) is str:
+        return id_value if '"' not in id_value else id_value.strip('"')
+    if type(id_value) is int:
+        return _int_id(id_value)
     return str(id_value).strip('"')
 
 
+@functools.lru_cache(maxsize=1024)
+def _int_id(id_value: int) -> str:
+    """String form of an integer ID, cached since agents revisit the same records"""
+    return str(id_value)
+
+
+@functools.lru_cache(maxsize=256)
+def _table_url(instance_name, workspace_id, table_id, record_id=None):
+    """Metadata API URL of a table, or of one of its records when record_id is given"""
+    url = f"{_meta_api(instance_name)}/workspace/{workspace_id}/table/{table_id}"
+    if record_id is not None:
+        url = f"{url}/content/{record_id}"
+    return url
+
+
+class _RequestBatcher(abc.ABC):
+    """Collects calls on one table arriving within a short window into batches
+
+    Subclasses implement _send(), which turns a batch of queued items into one
+    request and returns a result per item, in order. Debug logging is decided
+    per call: a batch logs if any of its callers asked for it.
+    """
+
+    def __init__(self, content_url, headers, max_batch_size=50, delay=0.005):
+        self.content_url = content_url
+        self.headers = headers
+        self.max_batch_size = max_batch_size
+        self.delay = delay
+        self._pending: List[tuple] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, item, debug=False):
+        """Queue an item and wait for its batch to complete"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, debug, future))
+        if self._task is None:
+            self._task = asyncio.create_task(self._drain())
+        return await future
+
+    async def _drain(self):
+        """Wait for the batching window to close, then send everything queued"""
+        await asyncio.sleep(self.delay)
+        pending, self._pending = self._pending, []
+        self._task = None
+
+        batches = [
+            pending[i:i + self.max_batch_size]
+            for i in range(0, len(pending), self.max_batch_size)
+        ]
+        await asyncio.gather(*(self._resolve(batch) for batch in batches))
+
+    async def _resolve(self, batch):
+        """Send one batch and hand each waiting caller its result"""
+        try:
+            debug = any(debug for _, debug, _ in batch)
+            results = await self._send([item for item, _, _ in batch], debug=debug)
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    @abc.abstractmethod
+    async def _send(self, items, debug=False):
+        """Send one batch and return a result per item, in order"""
+
+
+def _record_key(record_id):
+    """Normalized record ID, used both in batched searches and to match their results"""
+    record_id = str(record_id)
+    return int(record_id) if record_id.isdigit() else record_id
+
+
+async def _fetch_records(content_url, headers, record_ids, debug=False):
+    """Fetch several records from one table, returning a result per ID in order
+
+    The records are looked up with one POST to the table's content/search
+    endpoint using an ``id in (...)`` condition. A lone ID, a record missing
+    from the search results, or a search that fails falls back to the plain
+    record endpoint, so batching never turns a lookup that works on its own
+    into an error. A search that times out is the exception: its timeout goes
+    to every ID, keeping the lookup within the configured http_timeout.
+    """
+    async def get_one(record_id):
+        return await make_api_request(f"{content_url}/{record_id}", headers, debug=debug)
+
+    ids = list(dict.fromkeys(record_ids))
+    if len(ids) == 1:
+        result = await get_one(ids[0])
+        return [result] * len(record_ids)
+
+    if debug:
+        logger.info("Batching %s record lookups into one search request", len(ids))
+    keys = {record_id: _record_key(record_id) for record_id in ids}
+    data = {
+        "page": 1,
+        "per_page": len(ids),
+        "search": [{
+            "field": "id",
+            "operator": "in",
+            "value": list(dict.fromkeys(keys.values())),
+        }],
+    }
+    result = await make_api_request(
+        f"{content_url}/search", headers, method="POST", data=data, debug=debug
+    )
+
+    if result == {"error": "timeout"}:
+        # Fetching one by one would give each record a fresh http_timeout on top
+        return [result] * len(record_ids)
+
+    rows = {}
+    if isinstance(result, dict) and isinstance(result.get("items"), list):
+        rows = {
+            _record_key(row.get("id")): row
+            for row in result["items"] if isinstance(row, dict)
+        }
+    elif debug:
+        logger.error("Batched record search failed, fetching records one by one: %s", result)
+
+    # Anything the search did not return is fetched individually
+    missing = [record_id for record_id in ids if keys[record_id] not in rows]
+    fetched = await asyncio.gather(*(get_one(record_id) for record_id in missing))
+    results = {record_id: rows[keys[record_id]] for record_id in ids if keys[record_id] in rows}
+    results.update(zip(missing, fetched))
+    return [results[record_id] for record_id in record_ids]
+
+
+async def _with_full_records(content_url, headers, rows, debug=False):
+    """Replace bare IDs in a bulk create response with the created records
+
+    The bulk endpoint may answer with IDs rather than full records. Those are
+    re-fetched together; a record that cannot be fetched is returned as an
+    ``{"id": ...}`` stub.
+    """
+    ids = [str(row) for row in rows if not isinstance(row, dict)]
+    if not ids:
+        return rows
+    fetched = dict(zip(ids, await _fetch_records(content_url, headers, ids, debug=debug)))
+
+    records = []
+    for row in rows:
+        if not isinstance(row, dict):
+            record = fetched[str(row)]
+            row = record if isinstance(record, dict) and "error" not in record else {"id": row}
+        records.append(row)
+    return records
+
+
+class _BatchedRecordFetcher(_RequestBatcher):
+    """Coalesces concurrent record lookups on one table into a single search request
+
+    Lookups arriving within a short window are collected and resolved together
+    by _fetch_records().
+    """
+
+    async def _send(self, record_ids, debug=False):
+        return await _fetch_records(self.content_url, self.headers, record_ids, debug=debug)
+
+
+class _BatchedWriteQueue(_RequestBatcher):
+    """Coalesces concurrent record creates on one table into a single bulk request
+
+    Records created within a short window are sent together to the table's
+    content/bulk endpoint and each caller gets its record's slot of the
+    response, re-fetched if the endpoint answered with a bare ID. A lone
+    record still goes through the plain create endpoint.
+
+    If the bulk request is rejected (4xx) or never reaches Xano, each record is
+    created on its own so one invalid record does not fail the rest of its
+    window. Any other failure goes to every caller unretried, since the bulk
+    insert may already have been committed.
+    """
+
+    async def _create_one(self, record, debug=False):
+        return await make_api_request(
+            self.content_url, self.headers, method="POST", data=record, debug=debug
+        )
+
+    async def _send(self, records, debug=False):
+        if len(records) == 1:
+            return [await self._create_one(records[0], debug=debug)]
+
+        if debug:
+            logger.info("Batching %s record creates into one bulk request", len(records))
+        result = await make_api_request(
+            f"{self.content_url}/bulk", self.headers,
+            method="POST", data={"items": records}, debug=debug
+        )
+
+        if isinstance(result, dict) and "error" in result:
+            if not _never_applied(result):
+                # The bulk insert may have been committed, so retrying could duplicate records
+                return [result] * len(records)
+            if debug:
+                logger.error("Bulk create failed, creating records one by one: %s", result["error"])
+            return list(await asyncio.gather(
+                *(self._create_one(record, debug=debug) for record in records)
+            ))
+
+        if not isinstance(result, list) or len(result) != len(records):
+            # A response we cannot split per record goes to every caller
+            return [result] * len(records)
+
+        return await _with_full_records(self.content_url, self.headers, result, debug=debug)
+
+
+# Batchers keyed on (token, instance, workspace, table, batch size)
+_record_fetchers: Dict[tuple, _BatchedRecordFetcher] = {}
+_write_queues: Dict[tuple, _BatchedWriteQueue] = {}
+
+
+class _TTLCache:
+    """Small in-process cache whose entries expire after a fixed number of seconds"""
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self._entries: Dict[tuple, tuple] = {}
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key, value, seconds):
+        now = time.monotonic()
+        if key not in self._entries and len(self._entries) >= self.max_size:
+            # Sweep expired entries first, then evict the oldest if still full
+            for expired in [k for k, (expires_at, _) in self._entries.items() if expires_at < now]:
+                del self._entries[expired]
+            if len(self._entries) >= self.max_size:
+                del self._entries[next(iter(self._entries))]
+        self._entries[key] = (now + seconds, value)
+
+    def invalidate(self, *prefix):
+        """Drop every entry whose arguments start with the given prefix"""
+        for key in [k for k in self._entries if k[2][:len(prefix)] == prefix]:
+            del self._entries[key]
+
+
+class _Uncached(dict):
+    """A successful tool result that ttl_cache should not keep, such as a fallback"""
+
+
+_cache = _TTLCache()
+
+
+def ttl_cache(seconds=60):
+    """Cache a tool's successful results for a number of seconds
+
+    Entries are keyed on the tool name, the API token and the tool arguments
+    (IDs normalized with format_id). Error results and results wrapped in
+    _Uncached are never cached.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            config = bound.arguments.pop('config', None)
+            key = (
+                func.__name__,
+                get_token(config),
+                tuple(format_id(v) for v in bound.arguments.values()),
+            )
+
+            result = _cache.get(key)
+            if result is not None:
+                return result
+
+            result = await func(*args, **kwargs)
+            if "error" not in (result or {}) and not isinstance(result, _Uncached):
+                _cache.set(key, result, seconds)
+            return result
+
+        return wrapper
+    return decorator
+
+
 ##############################################
 # SECTION: INSTANCE AND DATABASE OPERATIONS
 ##############################################
 
 
+@functools.lru_cache(maxsize=16)
+def _instance_details(instance_name: str) -> Mapping[str, Any]:
+    """Details of a Xano instance, derived from its name alone"""
+    instance_domain = f"{instance_name}.n7c.xano.io"
+    return MappingProxyType({
+        "name": instance_name,
+        "display": instance_name.split("-")[0].upper(),
+        "xano_domain": instance_domain,
+        "rate_limit": False,
+        "meta_api": _meta_api(instance_name),
+        "meta_swagger": f"https://{instance_domain}/apispec:meta?type=json",
+    })
+
+
 @mcp.tool()
+@ttl_cache(seconds=60)
 async def xano_list_instances(config=None) -> Dict[str, Any]:
     """List all Xano instances associated with the account."""
     token = get_token(config)
     debug = config.get('debug', False) if config else False
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
+    headers = _headers(token)
 
     # First try the direct auth/me endpoint
     result = await make_api_request(f"{XANO_GLOBAL_API}/auth/me", headers, debug=debug)
@@ -146,7 +762,8 @@ async def xano_list_instances(config=None) -> Dict[str, Any]:
             "meta_swagger": "https://xnwv-v1z6-dvnr.n7c.xano.io/apispec:meta?type=json",
         }
     ]
-    return {"instances": instances}
+    # Not cached, so the real list is picked up as soon as auth/me recovers
+    return _Uncached(instances=instances)
 
 
 @mcp.tool()
@@ -156,19 +773,12 @@ async def xano_get_instance_details(instance_name: str, config=None) -> Dict[str
     Args:
         instance_name: The name of the Xano instance
     """
-    # Construct the instance details without making an API call
-    instance_domain = f"{instance_name}.n7c.xano.io"
-    return {
-        "name": instance_name,
-        "display": instance_name.split("-")[0].upper(),
-        "xano_domain": instance_domain,
-        "rate_limit": False,
-        "meta_api": f"https://{instance_domain}/api:meta",
-        "meta_swagger": f"https://{instance_domain}/apispec:meta?type=json",
-    }
+    # Constructed without an API call; copied so MCP can serialize a plain dict
+    return dict(_instance_details(instance_name))
 
 
 @mcp.tool()
+@ttl_cache(seconds=60)
 async def xano_list_databases(instance_name: str, config=None) -> Dict[str, Any]:
     """List all databases (workspaces) in a specific Xano instance.
 
@@ -178,19 +788,14 @@ async def xano_list_databases(instance_name: str, config=None) -> Dict[str, Any]
     token = get_token(config)
     debug = config.get('debug', False) if config else False
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
+    headers = _headers(token)
 
-    instance_domain = f"{instance_name}.n7c.xano.io"
-    meta_api = f"https://{instance_domain}/api:meta"
+    meta_api = _meta_api(instance_name)
 
     # Get the workspaces
     url = f"{meta_api}/workspace"
     if debug:
-        logger.info(f"Listing databases from URL: {url}")
+        logger.info("Listing databases from URL: %s", url)
     result = await make_api_request(url, headers, debug=debug)
 
     if "error" in result:
@@ -200,6 +805,7 @@ async def xano_list_databases(instance_name: str, config=None) -> Dict[str, Any]
 
 
 @mcp.tool()
+@ttl_cache(seconds=60)
 async def xano_get_workspace_details(
     instance_name: str, workspace_id: str, config=None
 ) -> Dict[str, Any]:
@@ -212,20 +818,15 @@ async def xano_get_workspace_details(
     token = get_token(config)
     debug = config.get('debug', False) if config else False
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
+    headers = _headers(token)
 
-    instance_domain = f"{instance_name}.n7c.xano.io"
-    meta_api = f"https://{instance_domain}/api:meta"
+    meta_api = _meta_api(instance_name)
 
     workspace_id = format_id(workspace_id)
 
     url = f"{meta_api}/workspace/{workspace_id}"
     if debug:
-        logger.info(f"Getting workspace details from URL: {url}")
+        logger.info("Getting workspace details from URL: %s", url)
     return await make_api_request(url, headers, debug=debug)
 
 
@@ -235,6 +836,7 @@ async def xano_get_workspace_details(
 
 
 @mcp.tool()
+@ttl_cache(seconds=60)
 async def xano_list_tables(instance_name: str, database_name: str, config=None) -> Dict[str, Any]:
     """List all tables in a specific Xano database (workspace).
 
@@ -245,20 +847,15 @@ async def xano_list_tables(instance_name: str, database_name: str, config=None)
     token = get_token(config)
     debug = config.get('debug', False) if config else False
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
+    headers = _headers(token)
 
-    instance_domain = f"{instance_name}.n7c.xano.io"
-    meta_api = f"https://{instance_domain}/api:meta"
+    meta_api = _meta_api(instance_name)
 
     database_name = format_id(database_name)
 
     url = f"{meta_api}/workspace/{database_name}/table"
     if debug:
-        logger.info(f"Listing tables from URL: {url}")
+        logger.info("Listing tables from URL: %s", url)
     result = await make_api_request(url, headers, debug=debug)
 
     if "error" in result:
@@ -281,24 +878,59 @@ async def xano_get_table_details(
     token = get_token(config)
     debug = config.get('debug', False) if config else False
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
-
-    instance_domain = f"{instance_name}.n7c.xano.io"
-    meta_api = f"https://{instance_domain}/api:meta"
+    headers = _headers(token)
 
     workspace_id = format_id(workspace_id)
     table_id = format_id(table_id)
 
-    url = f"{meta_api}/workspace/{workspace_id}/table/{table_id}"
+    url = _table_url(instance_name, workspace_id, table_id)
     if debug:
-        logger.info(f"Getting table details from URL: {url}")
+        logger.info("Getting table details from URL: %s", url)
     return await make_api_request(url, headers, debug=debug)
 
 
+@mcp.tool()
+async def xano_get_tables_details_bulk(
+    instance_name: str, workspace_id: str, table_ids: List[str], config=None
+) -> Dict[str, Any]:
+    """Get details for several Xano tables at once.
+
+    Args:
+        instance_name: The name of the Xano instance
+        workspace_id: The ID of the workspace
+        table_ids: The IDs of the tables
+    """
+    token = get_token(config)
+    debug = config.get('debug', False) if config else False
+    
+    headers = _headers(token)
+
+    workspace_id = format_id(workspace_id)
+    table_ids = [format_id(table_id) for table_id in table_ids]
+
+    # Fetch concurrently, but cap in-flight requests to go easy on the server
+    semaphore = asyncio.Semaphore(20)
+
+    async def fetch(table_id):
+        async with semaphore:
+            url = _table_url(instance_name, workspace_id, table_id)
+            return await make_api_request(url, headers, debug=debug)
+
+    if debug:
+        logger.info("Getting details for %s tables in workspace %s", len(table_ids), workspace_id)
+    results = await asyncio.gather(
+        *(fetch(table_id) for table_id in table_ids), return_exceptions=True
+    )
+
+    return {
+        table_id: (
+            {"error": f"Exception during API request: {str(result)}"}
+            if isinstance(result, Exception) else result
+        )
+        for table_id, result in zip(table_ids, results)
+    }
+
+
 ##############################################
 # SECTION: TABLE CONTENT OPERATIONS
 ##############################################
@@ -325,14 +957,7 @@ async def xano_browse_table_content(
     token = get_token(config)
     debug = config.get('debug', False) if config else False
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
-
-    instance_domain = f"{instance_name}.n7c.xano.io"
-    meta_api = f"https://{instance_domain}/api:meta"
+    headers = _headers(token)
 
     workspace_id = format_id(workspace_id)
     table_id = format_id(table_id)
@@ -340,10 +965,15 @@ async def xano_browse_table_content(
     # Prepare params
     params = {"page": page, "per_page": per_page}
 
-    url = f"{meta_api}/workspace/{workspace_id}/table/{table_id}/content"
+    url = f"{_table_url(instance_name, workspace_id, table_id)}/content"
     if debug:
-        logger.info(f"Browsing table content from URL: {url}")
-    return await make_api_request(url, headers, params=params, debug=debug)
+        logger.info("Browsing table content from URL: %s", url)
+
+    # Repeated browsing of a table reuses the same prepared request
+    request = _with_params(_prepared_get(url, token), params)
+    return await make_streaming_api_request(
+        url, headers, params=params, debug=debug, request=request
+    )
 
 
 @mcp.tool()
@@ -371,14 +1001,7 @@ async def xano_search_table_content(
     token = get_token(config)
     debug = config.get('debug', False) if config else False
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
-
-    instance_domain = f"{instance_name}.n7c.xano.io"
-    meta_api = f"https://{instance_domain}/api:meta"
+    headers = _headers(token)
 
     workspace_id = format_id(workspace_id)
     table_id = format_id(table_id)
@@ -392,10 +1015,10 @@ async def xano_search_table_content(
     if sort:
         data["sort"] = sort
 
-    url = f"{meta_api}/workspace/{workspace_id}/table/{table_id}/content/search"
+    url = f"{_table_url(instance_name, workspace_id, table_id)}/content/search"
     if debug:
-        logger.info(f"Searching table content at URL: {url}")
-    return await make_api_request(url, headers, method="POST", data=data, debug=debug)
+        logger.info("Searching table content at URL: %s", url)
+    return await make_streaming_api_request(url, headers, method="POST", data=data, debug=debug)
 
 
 @mcp.tool()
@@ -413,23 +1036,26 @@ async def xano_get_table_record(
     token = get_token(config)
     debug = config.get('debug', False) if config else False
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
-
-    instance_domain = f"{instance_name}.n7c.xano.io"
-    meta_api = f"https://{instance_domain}/api:meta"
+    headers = _headers(token)
 
     workspace_id = format_id(workspace_id)
     table_id = format_id(table_id)
     record_id = format_id(record_id)
 
-    url = f"{meta_api}/workspace/{workspace_id}/table/{table_id}/content/{record_id}"
+    # Concurrent lookups on the same table are coalesced into one request
+    key = (token, instance_name, workspace_id, table_id, _record_batch_size)
+    fetcher = _record_fetchers.get(key)
+    if fetcher is None:
+        fetcher = _BatchedRecordFetcher(
+            f"{_table_url(instance_name, workspace_id, table_id)}/content",
+            headers,
+            max_batch_size=_record_batch_size,
+        )
+        _record_fetchers[key] = fetcher
+
     if debug:
-        logger.info(f"Getting table record from URL: {url}")
-    return await make_api_request(url, headers, debug=debug)
+        logger.info("Getting table record %s from table %s", record_id, table_id)
+    return await fetcher.submit(record_id, debug=debug)
 
 
 @mcp.tool()
@@ -447,22 +1073,72 @@ async def xano_create_table_record(
     token = get_token(config)
     debug = config.get('debug', False) if config else False
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
+    headers = _headers(token)
 
-    instance_domain = f"{instance_name}.n7c.xano.io"
-    meta_api = f"https://{instance_domain}/api:meta"
+    workspace_id = format_id(workspace_id)
+    table_id = format_id(table_id)
+
+    url = f"{_table_url(instance_name, workspace_id, table_id)}/content"
+    if debug:
+        logger.info("Creating table record at URL: %s", url)
+
+    if _batch_writes:
+        # Opt-in: concurrent creates on the same table are sent as one bulk request
+        key = (token, instance_name, workspace_id, table_id, _write_batch_size)
+        queue = _write_queues.get(key)
+        if queue is None:
+            queue = _BatchedWriteQueue(url, headers, max_batch_size=_write_batch_size)
+            _write_queues[key] = queue
+        result = await queue.submit(record_data, debug=debug)
+    else:
+        result = await make_api_request(url, headers, method="POST", data=record_data, debug=debug)
+    if "error" not in (result or {}):
+        _cache.invalidate(instance_name, workspace_id)
+    return result
+
+
+@mcp.tool()
+async def xano_create_table_records_bulk(
+    instance_name: str,
+    workspace_id: str,
+    table_id: str,
+    records: List[Dict[str, Any]],
+    config=None
+) -> Dict[str, Any]:
+    """Create multiple records in a table with a single request.
+
+    Returns the created records; if Xano answers with bare IDs, the records are
+    re-fetched, and any that cannot be are returned as {"id": ...} stubs.
+
+    Args:
+        instance_name: The name of the Xano instance
+        workspace_id: The ID of the workspace
+        table_id: The ID of the table
+        records: The data for the new records
+    """
+    token = get_token(config)
+    debug = config.get('debug', False) if config else False
+    
+    headers = _headers(token)
 
     workspace_id = format_id(workspace_id)
     table_id = format_id(table_id)
 
-    url = f"{meta_api}/workspace/{workspace_id}/table/{table_id}/content"
+    content_url = f"{_table_url(instance_name, workspace_id, table_id)}/content"
+    url = f"{content_url}/bulk"
     if debug:
-        logger.info(f"Creating table record at URL: {url}")
-    return await make_api_request(url, headers, method="POST", data=record_data, debug=debug)
+        logger.info("Creating %s table records at URL: %s", len(records), url)
+    result = await make_api_request(
+        url, headers, method="POST", data={"items": records}, debug=debug
+    )
+
+    if "error" in (result or {}):
+        return result
+
+    _cache.invalidate(instance_name, workspace_id)
+    if isinstance(result, list):
+        result = await _with_full_records(content_url, headers, result, debug=debug)
+    return {"records": result}
 
 
 @mcp.tool()
@@ -486,23 +1162,19 @@ async def xano_update_table_record(
     token = get_token(config)
     debug = config.get('debug', False) if config else False
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
-
-    instance_domain = f"{instance_name}.n7c.xano.io"
-    meta_api = f"https://{instance_domain}/api:meta"
+    headers = _headers(token)
 
     workspace_id = format_id(workspace_id)
     table_id = format_id(table_id)
     record_id = format_id(record_id)
 
-    url = f"{meta_api}/workspace/{workspace_id}/table/{table_id}/content/{record_id}"
+    url = _table_url(instance_name, workspace_id, table_id, record_id)
     if debug:
-        logger.info(f"Updating table record at URL: {url}")
-    return await make_api_request(url, headers, method="PUT", data=record_data, debug=debug)
+        logger.info("Updating table record at URL: %s", url)
+    result = await make_api_request(url, headers, method="PUT", data=record_data, debug=debug)
+    if "error" not in (result or {}):
+        _cache.invalidate(instance_name, workspace_id)
+    return result
 
 
 @mcp.tool()
@@ -520,40 +1192,88 @@ async def xano_delete_table_record(
     token = get_token(config)
     debug = config.get('debug', False) if config else False
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
-
-    instance_domain = f"{instance_name}.n7c.xano.io"
-    meta_api = f"https://{instance_domain}/api:meta"
+    headers = _headers(token)
 
     workspace_id = format_id(workspace_id)
     table_id = format_id(table_id)
     record_id = format_id(record_id)
 
-    url = f"{meta_api}/workspace/{workspace_id}/table/{table_id}/content/{record_id}"
+    url = _table_url(instance_name, workspace_id, table_id, record_id)
     if debug:
-        logger.info(f"Deleting table record at URL: {url}")
-    return await make_api_request(url, headers, method="DELETE", debug=debug)
+        logger.info("Deleting table record at URL: %s", url)
+    result = await make_api_request(url, headers, method="DELETE", debug=debug)
+    if "error" not in (result or {}):
+        _cache.invalidate(instance_name, workspace_id)
+    return result
+
+
+async def _watch_signals(exit_on_signal=False, *, task_status=anyio.TASK_STATUS_IGNORED):
+    """Receive SIGINT and SIGTERM so shutdown runs cleanly
+
+    With exit_on_signal, the first signal closes the shared client and then
+    re-raises the signal with its default action, terminating the process.
+    Cancellation is not enough there: the stdio transport blocks reading stdin
+    in a worker thread that a cancel scope cannot interrupt. Otherwise signals
+    are only absorbed, leaving shutdown to a server that handles them itself.
+    """
+    try:
+        with anyio.open_signal_receiver(signal.SIGINT, signal.SIGTERM) as signals:
+            task_status.started()
+            async for signum in signals:
+                logger.info("Received %s, shutting down...", signal.Signals(signum).name)
+                if exit_on_signal:
+                    with anyio.CancelScope(shield=True):
+                        await close_client()
+                    signal.signal(signum, signal.SIG_DFL)
+                    signal.raise_signal(signum)
+    except NotImplementedError:
+        # Signal receivers are not available on Windows, rely on default handling there
+        task_status.started()
 
 
 async def run_mcp_server(transport="stdio", host="0.0.0.0", port=8000, config=None):
     """Run the MCP server with the specified transport
     
     Args:
-        transport: Transport type ("stdio" or "websocket")
-        host: Host to bind to for websocket transport
-        port: Port to bind to for websocket transport
+        transport: Transport type ("stdio" or "sse")
+        host: Host to bind to for SSE transport
+        port: Port to bind to for SSE transport
         config: Configuration dictionary
     """
-    if transport == "websocket":
-        logger.info(f"Starting Xano MCP server with WebSocket transport on {host}:{port}...")
-        await mcp.run_websocket(host=host, port=port, config=config)
-    else:  # Default to stdio
-        logger.info("Starting Xano MCP server with stdio transport...")
-        await mcp.run(transport="stdio", config=config)
+    # Resolve the token now so a missing token fails at startup, not mid-session
+    load_token(config)
+
+    global _http_timeout, _record_batch_size, _write_batch_size, _batch_writes
+    if config:
+        _http_timeout = config.get('http_timeout', DEFAULT_HTTP_TIMEOUT)
+        _record_batch_size = config.get('record_batch_size', DEFAULT_RECORD_BATCH_SIZE)
+        _write_batch_size = config.get('write_batch_size', DEFAULT_WRITE_BATCH_SIZE)
+        _batch_writes = config.get('batch_writes', False)
+
+    # Create the shared client up front so pool settings from config apply
+    get_client(config)
+
+    try:
+        async with anyio.create_task_group() as tg:
+            if transport == "sse":
+                # uvicorn shuts itself down gracefully on SIGINT/SIGTERM, then re-raises
+                # the signal; the receiver absorbs it so the client can still be closed
+                await tg.start(_watch_signals)
+                logger.info("Starting Xano MCP server with SSE transport on %s:%s...", host, port)
+                mcp.settings.host = host
+                mcp.settings.port = port
+                await mcp.run_sse_async()
+            else:  # Default to stdio
+                await tg.start(_watch_signals, True)
+                logger.info("Starting Xano MCP server with stdio transport...")
+                await mcp.run_stdio_async()
+
+            # The server returned on its own, stop watching for signals
+            tg.cancel_scope.cancel()
+    finally:
+        # Drain the shared connection pool on shutdown, even while being cancelled
+        with anyio.CancelScope(shield=True):
+            await close_client()
 
 
 def main():
@@ -561,20 +1281,20 @@ def main():
     parser = argparse.ArgumentParser(description="Xano MCP Server")
     parser.add_argument(
         "--transport", 
-        choices=["stdio", "websocket"], 
+        choices=["stdio", "sse"], 
         default="stdio",
-        help="Transport method (stdio or websocket)"
+        help="Transport method (stdio or sse)"
     )
     parser.add_argument(
         "--host", 
         default="0.0.0.0",
-        help="Host to bind to for websocket transport"
+        help="Host to bind to for SSE transport"
     )
     parser.add_argument(
         "--port", 
         type=int, 
         default=8000,
-        help="Port to bind to for websocket transport"
+        help="Port to bind to for SSE transport"
     )
     parser.add_argument(
         "--token", 
@@ -585,6 +1305,46 @@ def main():
         action="store_true",
         help="Enable debug logging"
     )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=DEFAULT_MAX_CONNECTIONS,
+        help="Maximum number of concurrent connections to Xano"
+    )
+    parser.add_argument(
+        "--max-keepalive-connections",
+        type=int,
+        default=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        help="Maximum number of idle connections kept alive in the pool"
+    )
+    parser.add_argument(
+        "--http-timeout",
+        type=float,
+        default=DEFAULT_HTTP_TIMEOUT,
+        help="Seconds to wait for a Xano API call before timing out"
+    )
+    parser.add_argument(
+        "--record-batch-size",
+        type=int,
+        default=DEFAULT_RECORD_BATCH_SIZE,
+        help="Maximum number of concurrent record lookups sent as one request"
+    )
+    parser.add_argument(
+        "--batch-writes",
+        action="store_true",
+        help="Send concurrent single-record creates on a table as one bulk request"
+    )
+    parser.add_argument(
+        "--write-batch-size",
+        type=int,
+        default=DEFAULT_WRITE_BATCH_SIZE,
+        help="Maximum number of records per batched bulk create"
+    )
+    parser.add_argument(
+        "--no-http2",
+        action="store_true",
+        help="Disable HTTP/2 for requests to Xano"
+    )
     
     args = parser.parse_args()
     
@@ -598,7 +1358,14 @@ def main():
     
     # Create config dict
     config = {
-        "debug": args.debug
+        "debug": args.debug,
+        "max_connections": args.max_connections,
+        "max_keepalive_connections": args.max_keepalive_connections,
+        "http2": not args.no_http2,
+        "http_timeout": args.http_timeout,
+        "record_batch_size": args.record_batch_size,
+        "batch_writes": args.batch_writes,
+        "write_batch_size": args.write_batch_size,
     }
     
     # Run the server